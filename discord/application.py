@@ -57,7 +57,7 @@ from .permissions import Permissions
 from .store import SKU, StoreAsset, StoreListing, SystemRequirements
 from .team import Team
 from .user import User, _UserTag
-from .utils import _bytes_to_base64_data, _parse_localizations
+from .utils import _bytes_to_base64_data, _parse_localizations, _stringify_localizations
 
 if TYPE_CHECKING:
     from datetime import date
@@ -122,6 +122,8 @@ __all__ = (
 
 MISSING = utils.MISSING
 
+_DEFAULT_SCOPES = ('bot', 'applications.commands')
+
 
 class Company(Hashable):
     """Represents a Discord company. This is usually the developer or publisher of an application.
@@ -353,15 +355,15 @@ class Achievement(Hashable):
             payload['icon'] = utils._bytes_to_base64_data(icon)
 
         if name is not MISSING or name_localizations is not MISSING:
-            localizations = (name_localizations or {}) if name_localizations is not MISSING else self.name_localizations
-            payload['name'] = {'default': name or self.name, 'localizations': {str(k): v for k, v in localizations.items()}}
+            localizations = name_localizations if name_localizations is not MISSING else self.name_localizations
+            payload['name'] = {'default': name or self.name, 'localizations': _stringify_localizations(localizations)}
         if description is not MISSING or description_localizations is not MISSING:
             localizations = (
-                (name_localizations or {}) if description_localizations is not MISSING else self.description_localizations
+                description_localizations if description_localizations is not MISSING else self.description_localizations
             )
             payload['description'] = {
                 'default': description or self.description,
-                'localizations': {str(k): v for k, v in localizations.items()},
+                'localizations': _stringify_localizations(localizations),
             }
 
         data = await self._state.http.edit_achievement(self.application_id, self.id, payload)
@@ -423,10 +425,11 @@ class ThirdPartySKU:
     __slots__ = ('application', 'distributor', 'id', 'sku_id')
 
     def __init__(self, *, data: ThirdPartySKUPayload, application: Union[PartialApplication, IntegrationApplication]):
+        get = data.get
         self.application = application
         self.distributor: Distributor = try_enum(Distributor, data['distributor'])
-        self.id: Optional[str] = data.get('id') or None
-        self.sku_id: Optional[str] = data.get('sku_id') or None
+        self.id: Optional[str] = get('id') or None
+        self.sku_id: Optional[str] = get('sku_id') or None
 
     def __repr__(self) -> str:
         return f'<ThirdPartySKU distributor={self.distributor!r} id={self.id!r} sku_id={self.sku_id!r}>'
@@ -903,14 +906,14 @@ class ApplicationInstallParams:
         self, application_id: int, *, scopes: Optional[Collection[str]] = None, permissions: Optional[Permissions] = None
     ):
         self.application_id: int = application_id
-        self.scopes: List[str] = [scope for scope in scopes] if scopes else ['bot', 'applications.commands']
+        self.scopes: List[str] = list(scopes or _DEFAULT_SCOPES)
         self.permissions: Permissions = permissions or Permissions(0)
 
     @classmethod
     def from_application(cls, application: Snowflake, data: ApplicationInstallParamsPayload) -> ApplicationInstallParams:
         return cls(
             application.id,
-            scopes=data.get('scopes', []),
+            scopes=data.get('scopes'),
             permissions=Permissions(int(data.get('permissions', 0))),
         )
 
@@ -965,7 +968,7 @@ class ApplicationAsset(AssetMixin, Hashable):
         The asset's name.
     """
 
-    __slots__ = ('_state', 'id', 'name', 'type', 'application')
+    __slots__ = ('_state', 'id', 'name', 'type', 'application', '_cs_url')
 
     def __init__(self, *, data: AssetPayload, application: Union[PartialApplication, IntegrationApplication]) -> None:
         self._state: ConnectionState = application._state
@@ -991,7 +994,7 @@ class ApplicationAsset(AssetMixin, Hashable):
         """:class:`bool`: Indicates if the asset is animated. Here for compatibility purposes."""
         return False
 
-    @property
+    @utils.cached_slot_property('_cs_url')
     def url(self) -> str:
         """:class:`str`: Returns the URL of the asset."""
         return f'{Asset.BASE}/app-assets/{self.application.id}/{self.id}.png'
@@ -1247,6 +1250,18 @@ class ApplicationBuild(Hashable):
         The version of the build, if any.
     """
 
+    __slots__ = (
+        'id',
+        'application_id',
+        'branch',
+        'created_at',
+        'status',
+        'source_build_id',
+        'version',
+        'manifests',
+        '_state',
+    )
+
     def __init__(self, *, data: BuildPayload, state: ConnectionState, branch: ApplicationBranch) -> None:
         self._state = state
         self.branch = branch
@@ -1887,8 +1902,10 @@ class PartialApplication(Hashable):
         owner: Optional[User]
         team: Optional[Team]
 
-    def __init__(self, *, state: ConnectionState, data: PartialApplicationPayload):
+    def __init__(self, *, state: ConnectionState, data: PartialApplicationPayload, team: Optional[Team] = None):
         self._state: ConnectionState = state
+        self.owner = None
+        self.team = team
         self._update(data)
 
     def __str__(self) -> str:
@@ -1904,13 +1921,14 @@ class PartialApplication(Hashable):
         self.verify_key: str = data['verify_key']
 
         self.aliases: List[str] = data.get('aliases', [])
-        self.developers: List[Company] = [Company(data=d) for d in data.get('developers', [])]
-        self.publishers: List[Company] = [Company(data=d) for d in data.get('publishers', [])]
+
+        self.developers: List[Company] = [Company(data=d) for d in data.get('developers') or ()]
+        self.publishers: List[Company] = [Company(data=d) for d in data.get('publishers') or ()]
         self.executables: List[ApplicationExecutable] = [
-            ApplicationExecutable(data=e, application=self) for e in data.get('executables', [])
+            ApplicationExecutable(data=e, application=self) for e in data.get('executables') or ()
         ]
         self.third_party_skus: List[ThirdPartySKU] = [
-            ThirdPartySKU(data=t, application=self) for t in data.get('third_party_skus', [])
+            ThirdPartySKU(data=t, application=self) for t in data.get('third_party_skus') or ()
         ]
 
         self._icon: Optional[str] = data.get('icon')
@@ -1921,7 +1939,8 @@ class PartialApplication(Hashable):
         self.privacy_policy_url: Optional[str] = data.get('privacy_policy_url')
         self.deeplink_uri: Optional[str] = data.get('deeplink_uri')
         self._flags: int = data.get('flags', 0)
-        self.type: Optional[ApplicationType] = try_enum(ApplicationType, data['type']) if data.get('type') else None
+        application_type = data.get('type')
+        self.type: Optional[ApplicationType] = try_enum(ApplicationType, application_type) if application_type else None
         self.hook: bool = data.get('hook', False)
         self.max_participants: Optional[int] = data.get('max_participants')
         self.tags: List[str] = data.get('tags', [])
@@ -1952,11 +1971,11 @@ class PartialApplication(Hashable):
 
         # Hacky, but I want these to be persisted
 
-        existing = getattr(self, 'owner', None)
         owner = data.get('owner')
-        self.owner = state.create_user(owner) if owner else existing
+        if owner:
+            self.owner = state.create_user(owner)
 
-        existing = getattr(self, 'team', None)
+        existing = self.team
         team = data.get('team')
         if existing and team:
             existing._update(team)
@@ -2092,7 +2111,7 @@ class PartialApplication(Hashable):
             The store listings.
         """
         state = self._state
-        data = await state.http.get_app_store_listings(self.id, country_code=state.country_code or 'US', localize=localize)
+        data = await state.http.get_app_store_listings(self.id, country_code=state.effective_country_code, localize=localize)
         return [StoreListing(state=state, data=d, application=self) for d in data]
 
     async def primary_store_listing(self, *, localize: bool = True) -> StoreListing:
@@ -2121,7 +2140,7 @@ class PartialApplication(Hashable):
             The application's primary store listing, if any.
         """
         state = self._state
-        data = await state.http.get_app_store_listing(self.id, country_code=state.country_code or 'US', localize=localize)
+        data = await state.http.get_app_store_listing(self.id, country_code=state.effective_country_code, localize=localize)
         return StoreListing(state=state, data=data, application=self)
 
     async def achievements(self, completed: bool = True) -> List[Achievement]:
@@ -2349,8 +2368,8 @@ class Application(PartialApplication):
         owner: User
 
     def __init__(self, *, state: ConnectionState, data: ApplicationPayload, team: Optional[Team] = None):
-        self.team = team
-        super().__init__(state=state, data=data)
+        self.bot: Optional[ApplicationBot] = None
+        super().__init__(state=state, data=data, team=team)
 
     def _update(self, data: ApplicationPayload) -> None:
         super()._update(data)
@@ -2373,12 +2392,13 @@ class Application(PartialApplication):
         state = self._state
 
         # Hacky, but I want these to be persisted
-        existing = getattr(self, 'bot', None)
+        existing = self.bot
         bot = data.get('bot')
-        if existing is not None:
-            existing._update(bot)
-        else:
-            self.bot: Optional[ApplicationBot] = ApplicationBot(data=bot, state=state, application=self) if bot else None
+        if bot:
+            if existing is not None and existing.id == int(bot['id']):
+                existing._update(bot)
+            else:
+                self.bot = ApplicationBot(data=bot, state=state, application=self)
 
         self.owner = self.owner or state.user
 
@@ -2566,9 +2586,9 @@ class Application(PartialApplication):
         if install_params is not MISSING:
             payload['install_params'] = install_params.to_dict() if install_params else None
         if developers is not MISSING:
-            payload['developer_ids'] = [developer.id for developer in developers or []]
+            payload['developer_ids'] = [developer.id for developer in developers] if developers else []
         if publishers is not MISSING:
-            payload['publisher_ids'] = [publisher.id for publisher in publishers or []]
+            payload['publisher_ids'] = [publisher.id for publisher in publishers] if publishers else []
         if guild:
             payload['guild_id'] = guild.id
 
@@ -2596,6 +2616,7 @@ class Application(PartialApplication):
         :class:`ApplicationBot`
             The bot attached to this application.
         """
+        # The bot cannot be fetched on its own, but an empty edit returns it unchanged
         data = await self._state.http.edit_bot(self.id, {})
         if not self.bot:
             self.bot = ApplicationBot(data=data, state=self._state, application=self)
@@ -2900,7 +2921,7 @@ class Application(PartialApplication):
         """
         state = self._state
         data = await self._state.http.get_app_skus(
-            self.id, country_code=state.country_code or 'US', with_bundled_skus=with_bundled_skus, localize=localize
+            self.id, country_code=state.effective_country_code, with_bundled_skus=with_bundled_skus, localize=localize
         )
         return [SKU(data=sku, state=state, application=self) for sku in data]
 
@@ -2932,7 +2953,7 @@ class Application(PartialApplication):
 
         state = self._state
         data = await self._state.http.get_sku(
-            self.primary_sku_id, country_code=state.country_code or 'US', localize=localize
+            self.primary_sku_id, country_code=state.effective_country_code, localize=localize
         )
         return SKU(data=data, state=state, application=self)
 
@@ -2964,7 +2985,7 @@ class Application(PartialApplication):
 
         state = self._state
         data = await self._state.http.get_sku(
-            self.store_listing_sku_id, country_code=state.country_code or 'US', localize=localize
+            self.store_listing_sku_id, country_code=state.effective_country_code, localize=localize
         )
         return SKU(data=data, state=state, application=self)
 
@@ -3052,13 +3073,13 @@ class Application(PartialApplication):
         """
         payload = {
             'type': int(type),
-            'name': {'default': name, 'localizations': {str(k): v for k, v in (name_localizations or {}).items()}},
+            'name': {'default': name, 'localizations': _stringify_localizations(name_localizations)},
             'application_id': self.id,
         }
         if legal_notice or legal_notice_localizations:
             payload['legal_notice'] = {
                 'default': legal_notice,
-                'localizations': {str(k): v for k, v in (legal_notice_localizations or {}).items()},
+                'localizations': _stringify_localizations(legal_notice_localizations),
             }
         if price_tier is not None:
             payload['price_tier'] = price_tier
@@ -3080,11 +3101,11 @@ class Application(PartialApplication):
             payload['genres'] = [int(g) for g in genres]
         if content_ratings:
             payload['content_ratings'] = {
-                content_rating.agency: content_rating.to_dict() for content_rating in content_ratings
+                str(content_rating.agency.value): content_rating.to_dict() for content_rating in content_ratings
             }
         if system_requirements:
             payload['system_requirements'] = {
-                system_requirement.os: system_requirement.to_dict() for system_requirement in system_requirements
+                str(system_requirement.os.value): system_requirement.to_dict() for system_requirement in system_requirements
             }
         if release_date is not None:
             payload['release_date'] = release_date.isoformat()
@@ -3718,8 +3739,12 @@ class IntegrationApplication(Hashable):
         '_icon',
         '_cover_image',
         '_splash',
+        '_cs_icon',
+        '_cs_cover_image',
     )
 
+    _CACHED_SLOTS = ('_cs_icon', '_cs_cover_image')
+
     def __init__(self, *, state: ConnectionState, data: BaseApplicationPayload):
         self._state: ConnectionState = state
         self._update(data)
@@ -3728,6 +3753,13 @@ class IntegrationApplication(Hashable):
         return self.name
 
     def _update(self, data: BaseApplicationPayload) -> None:
+        # Clear the cached properties
+        for attr in self._CACHED_SLOTS:
+            try:
+                delattr(self, attr)
+            except AttributeError:
+                pass
+
         self.id: int = int(data['id'])
         self.name: str = data['name']
         self.description: str = data.get('description') or ''
@@ -3755,14 +3787,14 @@ class IntegrationApplication(Hashable):
         """
         return utils.snowflake_time(self.id)
 
-    @property
+    @utils.cached_slot_property('_cs_icon')
     def icon(self) -> Optional[Asset]:
         """Optional[:class:`Asset`]: Retrieves the application's icon asset, if any."""
         if self._icon is None:
             return None
         return Asset._from_icon(self._state, self.id, self._icon, path='app')
 
-    @property
+    @utils.cached_slot_property('_cs_cover_image')
     def cover_image(self) -> Optional[Asset]:
         """Optional[:class:`Asset`]: Retrieves the application's cover image, if any."""
         if self._cover_image is None:
@@ -3825,7 +3857,7 @@ class IntegrationApplication(Hashable):
             The store listings.
         """
         state = self._state
-        data = await state.http.get_app_store_listings(self.id, country_code=state.country_code or 'US', localize=localize)
+        data = await state.http.get_app_store_listings(self.id, country_code=state.effective_country_code, localize=localize)
         return [StoreListing(state=state, data=d) for d in data]
 
     async def primary_store_listing(self, *, localize: bool = True) -> StoreListing:
@@ -3854,7 +3886,7 @@ class IntegrationApplication(Hashable):
             The application's primary store listing, if any.
         """
         state = self._state
-        data = await state.http.get_app_store_listing(self.id, country_code=state.country_code or 'US', localize=localize)
+        data = await state.http.get_app_store_listing(self.id, country_code=state.effective_country_code, localize=localize)
         return StoreListing(state=state, data=data)
 
     async def entitlements(self, *, exclude_consumed: bool = True) -> List[Entitlement]:
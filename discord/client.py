@@ -2651,7 +2651,7 @@ class Client:
             All available sticker packs.
         """
         state = self._connection
-        data = await self.http.list_premium_sticker_packs(state.country_code or 'US', state.locale)
+        data = await self.http.list_premium_sticker_packs(state.effective_country_code, state.locale)
         return [StickerPack(state=state, data=pack) for pack in data['sticker_packs']]
 
     async def fetch_sticker_pack(self, pack_id: int, /):
@@ -4211,7 +4211,7 @@ class Client:
             The applications in your library.
         """
         state = self._connection
-        data = await state.http.get_library_entries(state.country_code or 'US')
+        data = await state.http.get_library_entries(state.effective_country_code)
         return [LibraryApplication(state=state, data=d) for d in data]
 
     async def authorizations(self) -> List[OAuth2Token]:
@@ -4432,7 +4432,7 @@ class Client:
             The giftable entitlements for your account.
         """
         state = self._connection
-        data = await state.http.get_giftable_entitlements(state.country_code or 'US')
+        data = await state.http.get_giftable_entitlements(state.effective_country_code)
         return [Entitlement(state=state, data=d) for d in data]
 
     async def premium_entitlements(self, *, exclude_consumed: bool = True) -> List[Entitlement]:
@@ -4557,7 +4557,7 @@ class Client:
             The retrieved SKU.
         """
         state = self._connection
-        data = await state.http.get_sku(sku_id, country_code=state.country_code or 'US', localize=localize)
+        data = await state.http.get_sku(sku_id, country_code=state.effective_country_code, localize=localize)
         return SKU(state=state, data=data)
 
     async def fetch_store_listing(self, listing_id: int, /, *, localize: bool = True) -> StoreListing:
@@ -4590,7 +4590,7 @@ class Client:
             The store listing.
         """
         state = self._connection
-        data = await state.http.get_store_listing(listing_id, country_code=state.country_code or 'US', localize=localize)
+        data = await state.http.get_store_listing(listing_id, country_code=state.effective_country_code, localize=localize)
         return StoreListing(state=state, data=data)
 
     async def fetch_published_store_listing(self, sku_id: int, /, *, localize: bool = True) -> StoreListing:
@@ -4623,7 +4623,7 @@ class Client:
         state = self._connection
         data = await state.http.get_store_listing_by_sku(
             sku_id,
-            country_code=state.country_code or 'US',
+            country_code=state.effective_country_code,
             localize=localize,
         )
         return StoreListing(state=state, data=data)
@@ -4655,7 +4655,7 @@ class Client:
         """
         state = self._connection
         data = await state.http.get_app_store_listings(
-            application_id, country_code=state.country_code or 'US', localize=localize
+            application_id, country_code=state.effective_country_code, localize=localize
         )
         return [StoreListing(state=state, data=d) for d in data]
 
@@ -4690,7 +4690,7 @@ class Client:
         """
         state = self._connection
         data = await state.http.get_app_store_listing(
-            application_id, country_code=state.country_code or 'US', localize=localize
+            application_id, country_code=state.effective_country_code, localize=localize
         )
         return StoreListing(state=state, data=data)
 
@@ -4726,7 +4726,7 @@ class Client:
 
         state = self._connection
         data = await state.http.get_apps_store_listing(
-            application_ids, country_code=state.country_code or 'US', localize=localize
+            application_ids, country_code=state.effective_country_code, localize=localize
         )
         return [StoreListing(state=state, data=listing) for listing in data]
 
@@ -24,7 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, List, Literal, Optional, Tuple, Union, overload
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Literal, Optional, Tuple, Union, overload
 
 from .enums import ButtonStyle, ComponentType, InteractionType, TextStyle, try_enum
 from .interactions import _wrapped_interaction
@@ -193,17 +193,15 @@ class Button(Component):
     __repr_info__: ClassVar[Tuple[str, ...]] = __slots__
 
     def __init__(self, data: ButtonComponentPayload, message: Message):
+        get = data.get
         self.message = message
         self.style: ButtonStyle = try_enum(ButtonStyle, data['style'])
-        self.custom_id: Optional[str] = data.get('custom_id')
-        self.url: Optional[str] = data.get('url')
-        self.disabled: bool = data.get('disabled', False)
-        self.label: Optional[str] = data.get('label')
-        self.emoji: Optional[PartialEmoji]
-        try:
-            self.emoji = PartialEmoji.from_dict(data['emoji'])
-        except KeyError:
-            self.emoji = None
+        self.custom_id: Optional[str] = get('custom_id')
+        self.url: Optional[str] = get('url')
+        self.disabled: bool = get('disabled', False)
+        self.label: Optional[str] = get('label')
+        emoji = get('emoji')
+        self.emoji: Optional[PartialEmoji] = PartialEmoji.from_dict(emoji) if emoji else None
 
     @property
     def type(self) -> Literal[ComponentType.button]:
@@ -290,14 +288,15 @@ class SelectMenu(Component):
     __repr_info__: ClassVar[Tuple[str, ...]] = __slots__
 
     def __init__(self, data: SelectMenuPayload, message: Message):
+        get = data.get
         self.message = message
         self.custom_id: str = data['custom_id']
-        self.placeholder: Optional[str] = data.get('placeholder')
-        self.min_values: int = data.get('min_values', 1)
-        self.max_values: int = data.get('max_values', 1)
-        self.options: List[SelectOption] = [SelectOption.from_dict(option) for option in data.get('options', [])]
-        self.disabled: bool = data.get('disabled', False)
-        self.hash: str = data.get('hash', '')
+        self.placeholder: Optional[str] = get('placeholder')
+        self.min_values: int = get('min_values', 1)
+        self.max_values: int = get('max_values', 1)
+        self.options: List[SelectOption] = [SelectOption.from_dict(option) for option in get('options', [])]
+        self.disabled: bool = get('disabled', False)
+        self.hash: str = get('hash', '')
 
     @property
     def type(self) -> Literal[ComponentType.select]:
@@ -416,16 +415,12 @@ class SelectOption:
 
     @classmethod
     def from_dict(cls, data: SelectOptionPayload) -> SelectOption:
-        try:
-            emoji = PartialEmoji.from_dict(data['emoji'])
-        except KeyError:
-            emoji = None
-
+        emoji = data.get('emoji')
         return cls(
             label=data['label'],
             value=data['value'],
             description=data.get('description'),
-            emoji=emoji,
+            emoji=PartialEmoji.from_dict(emoji) if emoji else None,
             default=data.get('default', False),
         )
 
@@ -477,14 +472,15 @@ class TextInput(Component):
     )
 
     def __init__(self, data: TextInputPayload, *args) -> None:
+        get = data.get
         self.style: TextStyle = try_enum(TextStyle, data['style'])
         self.label: str = data['label']
         self.custom_id: str = data['custom_id']
-        self.placeholder: Optional[str] = data.get('placeholder')
-        self._value: Optional[str] = data.get('value')
-        self.required: bool = data.get('required', True)
-        self.min_length: Optional[int] = data.get('min_length')
-        self.max_length: Optional[int] = data.get('max_length')
+        self.placeholder: Optional[str] = get('placeholder')
+        self._value: Optional[str] = get('value')
+        self.required: bool = get('required', True)
+        self.min_length: Optional[int] = get('min_length')
+        self.max_length: Optional[int] = get('max_length')
 
     @property
     def type(self) -> Literal[ComponentType.text_input]:
@@ -540,6 +536,14 @@ class TextInput(Component):
         }
 
 
+_COMPONENT_TYPES: Dict[int, Callable[[Any, Message], Component]] = {
+    1: ActionRow,
+    2: Button,
+    3: SelectMenu,
+    4: TextInput,
+}
+
+
 @overload
 def _component_factory(data: ActionRowPayload, message: Message = ...) -> ActionRow:
     ...
@@ -566,11 +570,6 @@ def _component_factory(data: ComponentPayload, message: Message = ...) -> Option
 
 
 def _component_factory(data: ComponentPayload, message: Message = MISSING) -> Optional[Component]:
-    if data['type'] == 1:
-        return ActionRow(data, message)
-    elif data['type'] == 2:
-        return Button(data, message)
-    elif data['type'] == 3:
-        return SelectMenu(data, message)
-    elif data['type'] == 4:
-        return TextInput(data, message)
+    cls = _COMPONENT_TYPES.get(data['type'])
+    if cls is not None:
+        return cls(data, message)
@@ -120,7 +120,7 @@ class ExperimentFilters:
             You should query parameters via the properties rather than using this directly.
     """
 
-    __slots__ = ('population', 'options')
+    __slots__ = ('population', 'options', '_ids')
 
     # Most of these are taken from the client
     FILTER_KEYS: Final[Dict[int, str]] = {
@@ -143,6 +143,10 @@ class ExperimentFilters:
         self.population = population
         self.options: Metadata = self.array_object(data)
 
+        # Sorted once so eligibility checks can bisect, similar to ExperimentOverride
+        ids = self.ids
+        self._ids: Optional[SnowflakeList] = SnowflakeList(map(int, ids)) if ids is not None else None
+
     def __repr__(self) -> str:
         keys = (
             'features',
@@ -261,7 +265,7 @@ class ExperimentFilters:
         features = self.features
         if features is not None:
             # At least one feature must be present
-            if not any(feature in guild.features for feature in features):
+            if set(features).isdisjoint(guild.features):
                 return False
 
         id_range = self.id_range
@@ -282,9 +286,9 @@ class ExperimentFilters:
             if not self.in_range(guild.member_count, *member_count_range):
                 return False
 
-        ids = self.ids
+        ids = self._ids
         if ids is not None:
-            # Guild must be in the list of snowflakes, similar to ExperimentOverride
+            # Guild must be in the list of snowflakes
             if guild.id not in ids:
                 return False
 
@@ -367,22 +371,26 @@ class ExperimentPopulation:
         Raises
         ------
         :exc:`ValueError`
-            The experiment name is unset.
+            The experiment name is unset and the guild's position must be computed
+            (the guild passes the filters and no position was passed in).
 
         Returns
         -------
         :class:`int`
             The experiment bucket.
         """
+        if not self.filters.is_eligible(guild):
+            return -1
+
         if _result is None:
             _result = self.experiment.result_for(guild)
 
-        if not self.filters.is_eligible(guild):
-            return -1
+        return self._bucket_for_result(_result)
 
+    def _bucket_for_result(self, result: int, /) -> int:
         for rollout in self.rollouts:
             for start, end in rollout.ranges:
-                if start <= _result <= end:
+                if start <= result <= end:
                     return rollout.bucket
 
         return -1
@@ -658,7 +666,8 @@ class GuildExperiment:
         Raises
         ------
         :exc:`ValueError`
-            The experiment name is unset.
+            The experiment name is unset and the guild's position must be computed
+            (no override applies to the guild and it passes a population's filters).
 
         Returns
         -------
@@ -669,17 +678,25 @@ class GuildExperiment:
         if self.holdout and not self.holdout.is_eligible(guild):
             return -1
 
-        hash_result = self.result_for(guild)
-
         # Overrides take precedence
         # And yes, they can be assigned to a user ID
+        owner_id = guild.owner_id
         for override in self.overrides:
-            if guild.id in override.ids or guild.owner_id in override.ids:
+            if guild.id in override or (owner_id is not None and owner_id in override):
                 return override.bucket
 
+        if not self.overrides_formatted and (self.aa_mode or not self.populations):
+            return -1
+
+        # The position is only computed once a population's filters pass
+        hash_result = None
         for overrides in self.overrides_formatted:
             for override in overrides:
-                pop_bucket = override.bucket_for(guild, hash_result)
+                if not override.filters.is_eligible(guild):
+                    continue
+                if hash_result is None:
+                    hash_result = self.result_for(guild)
+                pop_bucket = override._bucket_for_result(hash_result)
                 if pop_bucket != -1:
                     return pop_bucket
 
@@ -688,7 +705,11 @@ class GuildExperiment:
             return -1
 
         for population in self.populations:
-            pop_bucket = population.bucket_for(guild, hash_result)
+            if not population.filters.is_eligible(guild):
+                continue
+            if hash_result is None:
+                hash_result = self.result_for(guild)
+            pop_bucket = population._bucket_for_result(hash_result)
             if pop_bucket != -1:
                 return pop_bucket
 
@@ -705,7 +726,8 @@ class GuildExperiment:
         Raises
         ------
         :exc:`ValueError`
-            The experiment name is unset.
+            The experiment name is unset and a guild's position must be computed
+            (no override applies to that guild and it passes a population's filters).
 
         Returns
         -------
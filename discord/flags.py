@@ -24,8 +24,6 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from functools import reduce
-from operator import or_
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -79,6 +77,8 @@ __all__ = (
 
 BF = TypeVar('BF', bound='BaseFlags')
 
+_USER_FLAGS_BY_VALUE: Dict[int, UserFlags] = {flag.value: flag for flag in UserFlags}
+
 
 class flag_value:
     def __init__(self, func: Callable[[Any], int]):
@@ -117,11 +117,18 @@ def fill_with_flags(*, inverted: bool = False) -> Callable[[Type[BF]], Type[BF]]
             for name, value in cls.__dict__.items()
             if isinstance(value, flag_value)
         }
+        cls._ITER_FLAGS = tuple(
+            (name, value.flag)
+            for name, value in cls.__dict__.items()
+            if isinstance(value, flag_value) and not isinstance(value, alias_flag_value)
+        )
         # fmt: on
 
+        max_bits = max(cls.VALID_FLAGS.values(), default=0).bit_length()
+        cls.ALL_VALUE = -1 + (2**max_bits)
+
         if inverted:
-            max_bits = max(cls.VALID_FLAGS.values()).bit_length()
-            cls.DEFAULT_VALUE = -1 + (2**max_bits)
+            cls.DEFAULT_VALUE = cls.ALL_VALUE
         else:
             cls.DEFAULT_VALUE = 0
 
@@ -134,6 +141,8 @@ def fill_with_flags(*, inverted: bool = False) -> Callable[[Type[BF]], Type[BF]]
 class BaseFlags:
     VALID_FLAGS: ClassVar[Dict[str, int]]
     DEFAULT_VALUE: ClassVar[int]
+    ALL_VALUE: ClassVar[int]
+    _ITER_FLAGS: ClassVar[Tuple[Tuple[str, int], ...]]
 
     value: int
 
@@ -142,9 +151,11 @@ class BaseFlags:
     def __init__(self, **kwargs: bool):
         self.value = self.DEFAULT_VALUE
         for key, value in kwargs.items():
-            if key not in self.VALID_FLAGS:
-                raise TypeError(f'{key!r} is not a valid flag name.')
-            setattr(self, key, value)
+            try:
+                flag = self.VALID_FLAGS[key]
+            except KeyError:
+                raise TypeError(f'{key!r} is not a valid flag name.') from None
+            self._set_flag(flag, value)
 
     @classmethod
     def _from_value(cls, value):
@@ -174,9 +185,7 @@ class BaseFlags:
         return self
 
     def __invert__(self) -> Self:
-        max_bits = max(self.VALID_FLAGS.values()).bit_length()
-        max_value = -1 + (2**max_bits)
-        return self._from_value(self.value ^ max_value)
+        return self._from_value(self.value ^ self.ALL_VALUE)
 
     def __bool__(self) -> bool:
         return self.value != self.DEFAULT_VALUE
@@ -188,18 +197,14 @@ class BaseFlags:
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        return self.value
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} value={self.value}>'
 
     def __iter__(self) -> Iterator[Tuple[str, bool]]:
-        for name, value in self.__class__.__dict__.items():
-            if isinstance(value, alias_flag_value):
-                continue
-
-            if isinstance(value, flag_value):
-                yield (name, self._has_flag(value.flag))
+        for name, flag in self._ITER_FLAGS:
+            yield (name, self._has_flag(flag))
 
     def _has_flag(self, o: int) -> bool:
         return (self.value & o) == o
@@ -218,14 +223,15 @@ class ArrayFlags(BaseFlags):
     def _from_value(cls: Type[Self], value: Sequence[int]) -> Self:
         self = cls.__new__(cls)
         # This is a micro-optimization given the frequency this object can be created.
-        # (1).__lshift__ is used in place of lambda x: 1 << x
-        # prebinding to a method of a constant rather than define a lambda.
-        # Pairing this with map, is essentially equivalent to (1 << x for x in value)
-        # reduction using operator.or_ instead of defining a lambda each call
+        # A plain loop with an in-place or is cheaper than map + reduce here,
+        # since it avoids a function call per element for both the shift and the or.
         # Discord sends these starting with a value of 1
         # Rather than subtract 1 from each element prior to left shift,
         # we shift right by 1 once at the end.
-        self.value = reduce(or_, map((1).__lshift__, value), 0) >> 1
+        flags = 0
+        for bit in value:
+            flags |= 1 << bit
+        self.value = flags >> 1
         return self
 
     def to_array(self) -> List[int]:
@@ -851,7 +857,16 @@ class PublicUserFlags(BaseFlags):
 
     def all(self) -> List[UserFlags]:
         """List[:class:`UserFlags`]: Returns all flags the user has."""
-        return [public_flag for public_flag in UserFlags if self._has_flag(public_flag.value)]
+        # Only visit the set bits, lowest first, which matches the definition order of UserFlags
+        value = self.value
+        flags = []
+        while value:
+            bit = value & -value
+            flag = _USER_FLAGS_BY_VALUE.get(bit)
+            if flag is not None:
+                flags.append(flag)
+            value ^= bit
+        return flags
 
 
 @fill_with_flags()
@@ -152,15 +152,16 @@ _log = logging.getLogger(__name__)
 
 
 async def json_or_text(response: aiohttp.ClientResponse) -> Union[Dict[str, Any], str]:
-    text = await response.text(encoding='utf-8')
+    # Both orjson and json accept bytes, so skip decoding to str when we can
+    data = await response.read()
     try:
         if response.headers['content-type'] == 'application/json':
-            return utils._from_json(text)
+            return utils._from_json(data)
     except KeyError:
         # Thanks Cloudflare
         pass
 
-    return text
+    return data.decode('utf-8')
 
 
 async def _gen_session(session: Optional[aiohttp.ClientSession]) -> aiohttp.ClientSession:
@@ -1035,7 +1035,7 @@ class ConnectionState:
         self.pending_payments: Dict[int, Payment] = {}
         self.analytics_token: Optional[str] = None
         self.preferred_rtc_regions: List[str] = []
-        self.country_code: Optional[str] = None
+        self.country_code = None
         self.api_code_version: int = 0
         self.session_type: Optional[str] = None
         self.auth_session_id: Optional[str] = None
@@ -1129,6 +1129,16 @@ class ConnectionState:
     def locale(self) -> str:
         return str(getattr(self.user, 'locale', 'en-US'))
 
+    @property
+    def country_code(self) -> Optional[str]:
+        return self._country_code
+
+    @country_code.setter
+    def country_code(self, value: Optional[str]) -> None:
+        self._country_code = value
+        # Resolved here as it's read on every store/SKU request
+        self.effective_country_code: str = value or 'US'
+
     @property
     def preferred_rtc_region(self) -> str:
         return self.preferred_rtc_regions[0] if self.preferred_rtc_regions else 'us-central'
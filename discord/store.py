@@ -1479,13 +1479,16 @@ class SKU(Hashable):
             payload['genres'] = [int(g) for g in genres] if genres else []
         if content_ratings is not MISSING:
             payload['content_ratings'] = (
-                {content_rating.agency: content_rating.to_dict() for content_rating in content_ratings}
+                {str(content_rating.agency.value): content_rating.to_dict() for content_rating in content_ratings}
                 if content_ratings
                 else {}
             )
         if system_requirements is not MISSING:
             payload['system_requirements'] = (
-                {system_requirement.os: system_requirement.to_dict() for system_requirement in system_requirements}
+                {
+                    str(system_requirement.os.value): system_requirement.to_dict()
+                    for system_requirement in system_requirements
+                }
                 if system_requirements
                 else {}
             )
@@ -1496,7 +1499,7 @@ class SKU(Hashable):
         if manifest_labels is not MISSING:
             payload['manifest_labels'] = [m.id for m in manifest_labels] if manifest_labels else []
 
-        data = await self._state.http.edit_sku(self.id, **payload)
+        data = await self._state.http.edit_sku(self.id, payload)
         self._update(data)
 
     async def subscription_plans(
@@ -2013,6 +2016,8 @@ class SubscriptionPlanPrices:
         A mapping of payment source IDs to the prices for that payment source.
     """
 
+    __slots__ = ('country_code', 'country_prices', 'payment_source_prices')
+
     def __init__(self, data: SubscriptionPricesPayload):
         country_prices = data.get('country_prices') or {}
         payment_source_prices = data.get('payment_source_prices') or {}
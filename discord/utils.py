@@ -1415,12 +1415,22 @@ def _generate_nonce() -> str:
 
 def _parse_localizations(data: Any, key: str) -> tuple[Any, dict]:
     values = data.get(key)
-    values = values if isinstance(values, dict) else {'default': values}
-    string = values['default']
-    localizations = {
-        try_enum(Locale, k): v for k, v in (values.get('localizations', data.get(f'{key}_localizations')) or {}).items()
-    }
-    return string, localizations
+    if isinstance(values, dict):
+        string = values['default']
+        localizations = values.get('localizations', data.get(f'{key}_localizations'))
+    else:
+        string = values
+        localizations = data.get(f'{key}_localizations')
+
+    if not localizations:
+        return string, {}
+    return string, {try_enum(Locale, k): v for k, v in localizations.items()}
+
+
+def _stringify_localizations(localizations: Optional[Mapping[Any, str]]) -> Dict[str, str]:
+    if not localizations:
+        return {}
+    return {str(k): v for k, v in localizations.items()}
 
 
 class ExpiringString(collections.UserString):
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.application
+
+"""
+
+import pytest
+
+import discord
+from discord import utils
+from discord.application import Achievement, Application, IntegrationApplication
+from discord.enums import (
+    ApplicationType,
+    ContentRatingAgency,
+    ESRBContentDescriptor,
+    ESRBRating,
+    Locale,
+    OperatingSystem,
+    PEGIContentDescriptor,
+    PEGIRating,
+    SKUType,
+)
+from discord.store import SKU, ContentRating, SystemRequirements
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.payloads = []
+
+    async def edit_achievement(self, application_id, achievement_id, payload):
+        self.payloads.append(payload)
+        return {'id': str(achievement_id), 'application_id': str(application_id), **payload}
+
+    async def create_sku(self, payload):
+        # Everything sent to Discord goes through the JSON encoder first
+        payload = utils._from_json(utils._to_json(payload))
+        self.payloads.append(payload)
+        return {'id': '3', 'slug': 'sku', **payload}
+
+    async def edit_sku(self, sku_id, payload):
+        payload = utils._from_json(utils._to_json(payload))
+        self.payloads.append(payload)
+        return {'id': str(sku_id), 'type': 1, 'slug': 'sku', 'application_id': '1', 'name': 'sku', **payload}
+
+
+class FakeState:
+    # Only what the objects under test touch
+    user = None
+    premium_subscriptions_application = discord.Object(id=0)
+
+    def __init__(self):
+        self.http = FakeHTTP()
+
+    def create_user(self, data):
+        return discord.User(state=self, data=data)
+
+
+def bot_payload(bot_id: int, username: str = 'bot') -> dict:
+    return {
+        'id': str(bot_id),
+        'username': username,
+        'discriminator': '0000',
+        'avatar': None,
+        'global_name': None,
+        'bot': True,
+    }
+
+
+def application_payload(**extra) -> dict:
+    data = {
+        'id': '1',
+        'name': 'app',
+        'description': '',
+        'verify_key': 'key',
+        'verification_state': 1,
+        'bot_public': True,
+    }
+    data.update(extra)
+    return data
+
+
+def test_application_update_keeps_bot_without_payload():
+    application = Application(state=FakeState(), data=application_payload(bot=bot_payload(10)))
+    bot = application.bot
+    assert bot is not None
+
+    application._update(application_payload())
+
+    assert application.bot is bot
+
+
+def test_application_update_refreshes_same_bot():
+    application = Application(state=FakeState(), data=application_payload(bot=bot_payload(10)))
+    bot = application.bot
+
+    application._update(application_payload(bot=bot_payload(10, 'renamed')))
+
+    assert application.bot is bot
+    assert application.bot.name == 'renamed'
+
+
+def test_application_update_replaces_different_bot():
+    application = Application(state=FakeState(), data=application_payload(bot=bot_payload(10)))
+    bot = application.bot
+
+    application._update(application_payload(bot=bot_payload(11)))
+
+    assert application.bot is not bot
+    assert application.bot is not None
+    assert application.bot.id == 11
+
+
+def test_partial_application_executables_and_third_party_skus():
+    application = Application(
+        state=FakeState(),
+        data=application_payload(
+            executables=[{'name': 'app.exe', 'os': 'win32', 'is_launcher': False}],
+            third_party_skus=[{'distributor': 'steam', 'id': '100', 'sku_id': '200'}],
+        ),
+    )
+
+    assert [executable.name for executable in application.executables] == ['app.exe']
+    assert application.executables[0].application is application
+    assert [sku.id for sku in application.third_party_skus] == ['100']
+
+    application.executables = []
+    application.third_party_skus = []
+    assert application.executables == []
+    assert application.third_party_skus == []
+
+    application._update(application_payload())
+    assert application.executables == []
+    assert application.third_party_skus == []
+
+
+def test_partial_application_primary_sku_url_tracks_updates():
+    application = Application(state=FakeState(), data=application_payload(primary_sku_id='5', slug='game'))
+    assert application.primary_sku_url == 'https://discord.com/store/skus/5/game'
+
+    application.slug = None
+    assert application.primary_sku_url == 'https://discord.com/store/skus/5/unknown'
+
+    application._update(application_payload())
+    assert application.primary_sku_url is None
+
+
+def test_integration_application_primary_sku_url_tracks_assignment():
+    application = IntegrationApplication(state=FakeState(), data={'id': '1', 'name': 'app', 'primary_sku_id': '5'})
+    assert application.primary_sku_url == 'https://discord.com/store/skus/5/unknown'
+
+    application.primary_sku_id = 6
+    assert application.primary_sku_url == 'https://discord.com/store/skus/6/unknown'
+
+
+@pytest.mark.parametrize('extra,expected', [({}, None), ({'type': 1}, ApplicationType.game)])
+def test_integration_application_type(extra, expected):
+    application = IntegrationApplication(state=FakeState(), data={'id': '1', 'name': 'app', **extra})
+
+    assert application.type == expected
+
+
+@pytest.mark.asyncio
+async def test_achievement_edit_sends_description_localizations():
+    state = FakeState()
+    achievement = Achievement(
+        state=state,
+        data={
+            'id': '2',
+            'application_id': '1',
+            'name': {'default': 'Name', 'localizations': {'fr': 'Nom'}},
+            'description': {'default': 'Description', 'localizations': {}},
+        },
+    )
+
+    await achievement.edit(description_localizations={Locale.german: 'Beschreibung'})
+
+    assert state.http.payloads[-1]['description'] == {
+        'default': 'Description',
+        'localizations': {'de': 'Beschreibung'},
+    }
+    assert achievement.description_localizations == {Locale.german: 'Beschreibung'}
+
+
+CONTENT_RATINGS = [
+    ContentRating(agency=ContentRatingAgency.esrb, rating=ESRBRating.teen, descriptors=[ESRBContentDescriptor.blood]),
+    ContentRating(agency=ContentRatingAgency.pegi, rating=PEGIRating.twelve, descriptors=[PEGIContentDescriptor.fear]),
+]
+CONTENT_RATINGS_PAYLOAD = {
+    '1': {'rating': ESRBRating.teen.value, 'descriptors': [ESRBContentDescriptor.blood.value]},
+    '2': {'rating': PEGIRating.twelve.value, 'descriptors': [PEGIContentDescriptor.fear.value]},
+}
+SYSTEM_REQUIREMENTS = [
+    SystemRequirements(OperatingSystem.windows, minimum_ram=4096),
+    SystemRequirements(OperatingSystem.linux, recommended_disk=2048),
+]
+
+
+@pytest.mark.asyncio
+async def test_create_sku_serializes_enum_keys():
+    state = FakeState()
+    application = Application(state=state, data=application_payload())
+
+    sku = await application.create_sku(
+        type=SKUType.durable_primary,
+        name='sku',
+        content_ratings=CONTENT_RATINGS,
+        system_requirements=SYSTEM_REQUIREMENTS,
+    )
+
+    payload = state.http.payloads[-1]
+    assert payload['content_ratings'] == CONTENT_RATINGS_PAYLOAD
+    assert list(payload['system_requirements']) == ['1', '3']
+    assert [rating.agency for rating in sku.content_ratings] == [ContentRatingAgency.esrb, ContentRatingAgency.pegi]
+    assert [reqs.os for reqs in sku.system_requirements] == [OperatingSystem.windows, OperatingSystem.linux]
+    assert sku.system_requirements[0].minimum_ram == 4096
+
+
+@pytest.mark.asyncio
+async def test_sku_edit_serializes_enum_keys():
+    state = FakeState()
+    sku = SKU(data={'id': '3', 'type': 1, 'slug': 'sku', 'application_id': '1', 'name': 'sku'}, state=state)
+
+    await sku.edit(content_ratings=CONTENT_RATINGS, system_requirements=SYSTEM_REQUIREMENTS)
+    assert state.http.payloads[-1]['content_ratings'] == CONTENT_RATINGS_PAYLOAD
+    assert list(state.http.payloads[-1]['system_requirements']) == ['1', '3']
+    assert [reqs.os for reqs in sku.system_requirements] == [OperatingSystem.windows, OperatingSystem.linux]
+    assert sku.system_requirements[1].recommended_disk == 2048
+
+    await sku.edit(content_ratings=[], system_requirements=[])
+    assert state.http.payloads[-1]['content_ratings'] == {}
+    assert state.http.payloads[-1]['system_requirements'] == {}
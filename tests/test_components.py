@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.components
+
+"""
+
+from discord.components import SelectMenu, SelectOption
+
+
+SELECT_PAYLOAD = {
+    'type': 3,
+    'custom_id': 'menu',
+    'options': [
+        {'label': 'One', 'value': '1', 'emoji': {'name': '\N{DIGIT ONE}'}},
+        {'label': 'Two', 'value': '2', 'description': 'The second', 'default': True},
+    ],
+}
+
+
+def test_select_menu_construct():
+    menu = SelectMenu(SELECT_PAYLOAD, None)  # type: ignore
+
+    assert menu.custom_id == 'menu'
+    assert menu.min_values == 1
+    assert menu.max_values == 1
+    assert [option.value for option in menu.options] == ['1', '2']
+    assert menu.options[0].emoji is not None and menu.options[0].emoji.name == '\N{DIGIT ONE}'
+    assert menu.options[1].emoji is None
+    assert menu.options[1].description == 'The second'
+    assert menu.options[1].default is True
+
+
+def test_select_menu_repr():
+    menu = SelectMenu(SELECT_PAYLOAD, None)  # type: ignore
+
+    assert repr(menu).startswith("<SelectMenu custom_id='menu' ")
+    assert 'options=[<SelectOption label=' in repr(menu)
+
+
+def test_select_menu_options_assignment():
+    menu = SelectMenu(SELECT_PAYLOAD, None)  # type: ignore
+    option = SelectOption(label='Three')
+
+    menu.options = [option]
+
+    assert menu.options == [option]
+    assert option.value == 'Three'
+
+
+def test_select_menu_raw_construct():
+    option = SelectOption(label='One', value='1')
+    menu = SelectMenu._raw_construct(custom_id='raw', options=[option], disabled=True)
+
+    assert menu.custom_id == 'raw'
+    assert menu.options == [option]
+    assert menu.disabled is True
+
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.experiment
+
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from discord.experiment import GuildExperiment
+from discord.utils import murmurhash32
+
+
+NAME = '2021-06_test_experiment'
+FULL_ROLLOUT = [[1, [{'s': 0, 'e': 9999}]]]
+COMMUNITY_FILTER = [[1604612045, [[1183251248, ['COMMUNITY']]]]]
+
+
+def make_guild(id: int = 100, owner_id: int = 200, features=()) -> SimpleNamespace:
+    return SimpleNamespace(id=id, owner_id=owner_id, features=list(features))
+
+
+def make_experiment(*, populations=(), overrides=(), overrides_formatted=(), aa_mode=0) -> GuildExperiment:
+    data = [murmurhash32(NAME, signed=False), None, 1, populations, overrides, overrides_formatted, None, None, aa_mode, 0]
+    return GuildExperiment(state=None, data=data)  # type: ignore
+
+
+@pytest.mark.parametrize('override_id', [100, 200])
+def test_bucket_for_override_without_name(override_id):
+    experiment = make_experiment(
+        populations=[[FULL_ROLLOUT, []]],
+        overrides=[{'b': 2, 'k': [str(override_id)]}],
+    )
+
+    assert experiment.bucket_for(make_guild()) == 2
+
+
+def test_bucket_for_no_populations_without_name():
+    experiment = make_experiment()
+
+    assert experiment.bucket_for(make_guild()) == -1
+
+
+def test_bucket_for_aa_mode_without_name():
+    experiment = make_experiment(populations=[[FULL_ROLLOUT, []]], aa_mode=1)
+
+    assert experiment.bucket_for(make_guild()) == -1
+
+
+def test_bucket_for_ineligible_guild_without_name():
+    experiment = make_experiment(
+        populations=[[FULL_ROLLOUT, COMMUNITY_FILTER]],
+        overrides_formatted=[[[FULL_ROLLOUT, COMMUNITY_FILTER]]],
+    )
+
+    assert experiment.bucket_for(make_guild()) == -1
+
+
+def test_bucket_for_eligible_guild_requires_name():
+    experiment = make_experiment(populations=[[FULL_ROLLOUT, COMMUNITY_FILTER]])
+    guild = make_guild(features=['COMMUNITY'])
+
+    with pytest.raises(ValueError):
+        experiment.bucket_for(guild)
+
+    experiment.name = NAME
+    assert experiment.bucket_for(guild) == 1
+
+
+def test_bucket_for_rollout_position():
+    experiment = make_experiment(populations=[[[[1, [{'s': 0, 'e': 4999}]], [2, [{'s': 5000, 'e': 9999}]]], []]])
+    experiment.name = NAME
+    guild = make_guild()
+
+    expected = 1 if experiment.result_for(guild) < 5000 else 2
+    assert experiment.bucket_for(guild) == expected
+    assert experiment.populations[0].bucket_for(guild) == expected
+
+
+@pytest.mark.parametrize('guild_id,expected', [(100, 1), (150, -1)])
+def test_bucket_for_ids_filter(guild_id, expected):
+    experiment = make_experiment(populations=[[FULL_ROLLOUT, [[3013771838, [[3013771838, ['300', '100']]]]]]])
+    experiment.name = NAME
+
+    assert experiment.populations[0].filters.ids == [300, 100]
+    assert experiment.bucket_for(make_guild(id=guild_id)) == expected
@@ -17,6 +17,7 @@ import typing
 import pytest
 
 from discord import utils
+from discord.enums import Locale
 
 
 # Async generator for async support
@@ -334,3 +335,34 @@ def test_is_inside_class():
 )
 def test_format_dt(dt: datetime.datetime, style: typing.Optional[utils.TimestampStyle], formatted: str):
     assert utils.format_dt(dt, style=style) == formatted
+
+
+@pytest.mark.parametrize(
+    ('data', 'expected'),
+    [
+        ({'name': 'plain'}, ('plain', {})),
+        ({'name': None}, (None, {})),
+        ({'name': {'default': 'hello', 'localizations': {'fr': 'bonjour'}}}, ('hello', {Locale.french: 'bonjour'})),
+        ({'name': {'default': 'hello', 'localizations': {}}}, ('hello', {})),
+        ({'name': 'hello', 'name_localizations': {'de': 'hallo'}}, ('hello', {Locale.german: 'hallo'})),
+        ({'name': {'default': 'hello'}, 'name_localizations': {'de': 'hallo'}}, ('hello', {Locale.german: 'hallo'})),
+        ({'name': 'hello', 'name_localizations': None}, ('hello', {})),
+    ],
+)
+def test_parse_localizations(data: typing.Dict[str, typing.Any], expected: typing.Tuple[typing.Any, dict]):
+    assert utils._parse_localizations(data, 'name') == expected
+
+
+@pytest.mark.parametrize(
+    ('localizations', 'expected'),
+    [
+        (None, {}),
+        ({}, {}),
+        ({Locale.french: 'bonjour', Locale.german: 'hallo'}, {'fr': 'bonjour', 'de': 'hallo'}),
+        ({'en-US': 'hello'}, {'en-US': 'hello'}),
+    ],
+)
+def test_stringify_localizations(
+    localizations: typing.Optional[typing.Mapping[typing.Any, str]], expected: typing.Dict[str, str]
+):
+    assert utils._stringify_localizations(localizations) == expected